@@ -37,7 +37,7 @@ class ComponentPublisher:
         self._config = config
         self._component = component
         self._port = None
-        self.methods = get_remote_methods(type(component)).keys()
+        self.methods = frozenset(get_remote_methods(type(component)))
 
     def start(self):
         """Start accepting connections."""
@@ -418,6 +418,7 @@ class MessageExchange:
         self._urgent_exchange = False
         self._client_accepted_types = set()
         self._client_accepted_types_hash = None
+        self._client_accepted_types_digest = None
         self._message_handlers = {}
         self._exchange_store = exchange_store
         self._stopped = False
@@ -760,7 +761,7 @@ class MessageExchange:
         the L{__init__} method.
         """
         store = self._message_store
-        accepted_types_digest = self._hash_types(store.get_accepted_types())
+        accepted_types_digest = store.get_accepted_types_digest()
         messages = store.get_pending_messages(self._max_messages)
         total_messages = store.count_pending_messages()
         if messages:
@@ -788,9 +789,9 @@ class MessageExchange:
             "total-messages": total_messages,
             "next-expected-sequence": store.get_server_sequence(),
         }
-        accepted_client_types = self.get_client_accepted_message_types()
-        accepted_client_types_hash = self._hash_types(accepted_client_types)
+        accepted_client_types_hash = self._get_client_accepted_types_digest()
         if accepted_client_types_hash != self._client_accepted_types_hash:
+            accepted_client_types = self.get_client_accepted_message_types()
             payload["client-accepted-types"] = accepted_client_types
         return payload
 
@@ -798,6 +799,17 @@ class MessageExchange:
         accepted_types_str = ";".join(types).encode("ascii")
         return md5(accepted_types_str).digest()
 
+    def _get_client_accepted_types_digest(self):
+        """Get the MD5 digest of the client accepted message types.
+
+        The digest is cached until a new type gets registered.
+        """
+        if self._client_accepted_types_digest is None:
+            self._client_accepted_types_digest = self._hash_types(
+                self.get_client_accepted_message_types(),
+            )
+        return self._client_accepted_types_digest
+
     def _handle_result(self, payload, result):
         """Handle a response from the server.
 
@@ -908,6 +920,7 @@ class MessageExchange:
         """
         self._message_handlers.setdefault(type, []).append(handler)
         self._client_accepted_types.add(type)
+        self._client_accepted_types_digest = None
 
     def handle_message(self, message):
         """
@@ -935,6 +948,7 @@ class MessageExchange:
     def register_client_accepted_message_type(self, type):
         # stringify the type for sanity and less confusing logs.
         self._client_accepted_types.add(str(type))
+        self._client_accepted_types_digest = None
 
     def get_client_accepted_message_types(self):
         return sorted(self._client_accepted_types)
@@ -947,9 +961,9 @@ def get_accepted_types_diff(old_types, new_types):
     stable_types = old_types & new_types
     removed_types = old_types - new_types
     diff = []
-    diff.extend([f"+{typ}" for typ in added_types])
-    diff.extend([f"{typ}" for typ in stable_types])
-    diff.extend([f"-{typ}" for typ in removed_types])
+    diff.extend([f"+{typ}" for typ in sorted(added_types)])
+    diff.extend(sorted(stable_types))
+    diff.extend([f"-{typ}" for typ in sorted(removed_types)])
     return " ".join(diff)
 
 
@@ -240,6 +240,17 @@ class BrokerServer:
         """Indicate if a message with given C{message_id} is pending."""
         return self._message_store.is_pending(message_id)
 
+    @remote
+    def are_messages_pending(self, message_ids):
+        """Indicate which messages with given C{message_ids} are pending.
+
+        This lets callers checking many messages do it with a single remote
+        call, rather than calling L{is_message_pending} for each of them.
+
+        @return: A list with a bool for each of the given C{message_ids}.
+        """
+        return self._message_store.are_pending(message_ids)
+
     @remote
     def stop_clients(self):
         """Tell all the clients to exit."""
@@ -104,6 +104,7 @@ from landscape import DEFAULT_SERVER_API
 from landscape.lib import bpickle
 from landscape.lib.fs import create_binary_file
 from landscape.lib.fs import read_binary_file
+from landscape.lib.hashlib import md5
 from landscape.lib.versioning import is_version_higher
 from landscape.lib.versioning import sort_versions
 
@@ -150,6 +151,7 @@ class MessageStore:
         self._max_dirs = max_dirs  # Maximum number of directories in store
         self._max_size_mb = max_size_mb  # Maximum size of message store
         self._schemas = {}
+        self._accepted_types_digest = None
         self._original_persist = persist
         self._persist = persist.root_at("message-store")
         message_dir = self._message_dir()
@@ -169,12 +171,25 @@ class MessageStore:
         """
         assert type(types) in (tuple, list, set)
         self._persist.set("accepted-types", sorted(set(types)))
+        self._accepted_types_digest = None
         self._reprocess_holding()
 
     def get_accepted_types(self):
         """Get a list of all accepted message types."""
         return self._persist.get("accepted-types", ())
 
+    def get_accepted_types_digest(self):
+        """Get the MD5 digest of the accepted message types.
+
+        The digest is computed the first time it's needed and then cached
+        until the accepted types get changed with L{set_accepted_types}.
+        """
+        if self._accepted_types_digest is None:
+            accepted_types = ";".join(self.get_accepted_types())
+            digest = md5(accepted_types.encode("ascii")).digest()
+            self._accepted_types_digest = digest
+        return self._accepted_types_digest
+
     def accepts(self, type):
         """Return bool indicating if C{type} is an accepted message type."""
         return type in self.get_accepted_types()
@@ -271,7 +286,7 @@ class MessageStore:
 
     def get_pending_messages(self, max=None):
         """Get any pending messages that aren't being held, up to max."""
-        accepted_types = self.get_accepted_types()
+        accepted_types = set(self.get_accepted_types())
         server_api = self.get_server_api()
         messages = []
         for filename in self._walk_pending_messages():
@@ -378,17 +393,33 @@ class MessageStore:
 
         @param message_id: Identifier returned by the L{add()} method.
         """
+        return self.are_pending([message_id])[0]
+
+    def are_pending(self, message_ids):
+        """Return bools indicating which of C{message_ids} are undelivered.
+
+        This is like L{is_pending}, but it checks all the given messages
+        with a single walk of the message store.
+
+        @param message_ids: A list of identifiers returned by L{add()}.
+        @return: A list with a bool for each of the given C{message_ids}.
+        """
+        remaining = set(message_ids)
+        pending = set()
         i = 0
         pending_offset = self.get_pending_offset()
         for filename in self._walk_messages(exclude=BROKEN):
+            if not remaining:
+                break
             flags = self._get_flags(filename)
-            if (HELD in flags or i >= pending_offset) and os.stat(
-                filename,
-            ).st_ino == message_id:
-                return True
+            if HELD in flags or i >= pending_offset:
+                message_id = os.stat(filename).st_ino
+                if message_id in remaining:
+                    remaining.remove(message_id)
+                    pending.add(message_id)
             if BROKEN not in flags and HELD not in flags:
                 i += 1
-        return False
+        return [message_id in pending for message_id in message_ids]
 
     def record_success(self, timestamp):
         """Record a successful exchange."""
@@ -526,7 +557,7 @@ class MessageStore:
         """
         offset = 0
         pending_offset = self.get_pending_offset()
-        accepted_types = self.get_accepted_types()
+        accepted_types = set(self.get_accepted_types())
         for old_filename in self._walk_messages():
             flags = self._get_flags(old_filename)
             try:
@@ -71,6 +71,15 @@ class RemoteBrokerTest(LandscapeTest):
         result = self.remote.is_message_pending(1234)
         return self.assertSuccess(result, False)
 
+    def test_are_messages_pending(self):
+        """
+        The L{RemoteBroker.are_messages_pending} method calls the
+        C{are_messages_pending} method of the remote L{BrokerServer} instance
+        and returns its result with a L{Deferred}.
+        """
+        result = self.remote.are_messages_pending([1234, 5678])
+        return self.assertSuccess(result, [False, False])
+
     def test_stop_clients(self):
         """
         The L{RemoteBroker.stop_clients} method calls the C{stop_clients}
@@ -263,6 +263,21 @@ class MessageExchangeTest(LandscapeTest):
         self.assertIn("accepted-types", payload)
         self.assertEqual(payload["accepted-types"], md5(b"ack;bar").digest())
 
+    def test_wb_accepted_types_change_updates_digest(self):
+        """
+        When the accepted types change, the digest included in the payloads
+        gets updated, even if a payload was already built before.
+        """
+        self.exchanger.handle_message(
+            {"type": "accepted-types", "types": ["ack", "bar"]},
+        )
+        self.exchanger._make_payload()
+        self.exchanger.handle_message(
+            {"type": "accepted-types", "types": ["ack"]},
+        )
+        payload = self.exchanger._make_payload()
+        self.assertEqual(payload["accepted-types"], md5(b"ack").digest())
+
     def test_accepted_types_causes_urgent_if_held_messages_exist(self):
         """
         If an accepted-types message makes available a type for which we
@@ -1465,6 +1480,24 @@ class AcceptedTypesMessageExchangeTest(LandscapeTest):
             sorted(["type-A", "type-B"] + DEFAULT_ACCEPTED_TYPES),
         )
 
+    def test_exchange_sends_new_accepted_types_after_register_message(self):
+        """
+        Registering a message handler adds its type to the client accepted
+        types, so the next exchange sends the updated list to the server.
+        """
+        types = self.exchanger.get_client_accepted_message_types()
+        types_hash = md5(";".join(types).encode("ascii")).digest()
+        self.transport.extra["client-accepted-types-hash"] = types_hash
+        self.exchanger.exchange()
+        self.exchanger.exchange()
+        self.assertNotIn("client-accepted-types", self.transport.payloads[1])
+        self.exchanger.register_message("type-C", lambda message: None)
+        self.exchanger.exchange()
+        self.assertEqual(
+            self.transport.payloads[2]["client-accepted-types"],
+            sorted(types + ["type-C"]),
+        )
+
     def test_exchange_sends_new_types_when_server_screws_up(self):
         """
         If the server suddenly and without warning changes the hash of
@@ -1512,3 +1545,16 @@ class GetAcceptedTypesDiffTest(LandscapeTest):
             get_accepted_types_diff(["foo", "bar"], ["foo", "ooga"]),
             "+ooga foo -bar",
         )
+
+    def test_diff_is_sorted(self):
+        """
+        The types in each group of the diff are sorted, so the logged diff
+        doesn't depend on set ordering.
+        """
+        self.assertEqual(
+            get_accepted_types_diff(
+                ["d", "c", "b", "a"],
+                ["f", "e", "b", "a"],
+            ),
+            "+e +f a b -c -d",
+        )
@@ -171,6 +171,20 @@ class BrokerServerTest(LandscapeTest):
         message_id = self.broker.send_message(message, session_id)
         self.assertTrue(self.broker.is_message_pending(message_id))
 
+    def test_are_messages_pending(self):
+        """
+        The L{BrokerServer.are_messages_pending} method indicates which of
+        the messages with the given ids are waiting for delivery.
+        """
+        message = {"type": "test"}
+        self.mstore.set_accepted_types(["test"])
+        session_id = self.broker.get_session_id()
+        message_id = self.broker.send_message(message, session_id)
+        self.assertEqual(
+            [False, True],
+            self.broker.are_messages_pending([123, message_id]),
+        )
+
     def test_register_client(self):
         """
         The L{BrokerServer.register_client} method can be used to register
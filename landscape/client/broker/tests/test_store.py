@@ -6,6 +6,7 @@ from twisted.python.compat import intToBytes
 from landscape.client.broker.store import MessageStore
 from landscape.client.tests.helpers import LandscapeTest
 from landscape.lib.bpickle import dumps
+from landscape.lib.hashlib import md5
 from landscape.lib.persist import Persist
 from landscape.lib.schema import Bytes
 from landscape.lib.schema import Int
@@ -522,6 +523,20 @@ class MessageStoreTest(LandscapeTest):
         self.store.add({"type": "data", "data": b"yay"})
         self.assertEqual(self.store.count_pending_messages(), 2)
 
+    def test_get_accepted_types_digest(self):
+        """
+        L{MessageStore.get_accepted_types_digest} returns the MD5 digest of
+        the accepted types, which is updated when they change.
+        """
+        self.store.set_accepted_types([])
+        digest = self.store.get_accepted_types_digest()
+        self.assertEqual(md5(b"").digest(), digest)
+        self.store.set_accepted_types(["foo", "bar"])
+        self.assertEqual(
+            md5(b"bar;foo").digest(),
+            self.store.get_accepted_types_digest(),
+        )
+
     def test_commit(self):
         """
         The Message Store can be told to save its persistent data to disk on
@@ -601,6 +616,21 @@ class MessageStoreTest(LandscapeTest):
 
         self.assertFalse(self.store.is_pending(id))
 
+    def test_are_pending(self):
+        """
+        L{MessageStore.are_pending} tells which of the given messages are
+        still pending, preserving the order of the given identifiers.
+        """
+        self.store.set_accepted_types(["empty"])
+        id1 = self.store.add({"type": "empty"})
+        id2 = self.store.add({"type": "empty"})
+        id3 = self.store.add({"type": "data", "data": b"A thing"})
+        self.store.add_pending_offset(1)
+        self.assertEqual(
+            [True, False, True, False],
+            self.store.are_pending([id2, id1, id3, 123456789]),
+        )
+
     def test_get_session_id_returns_the_same_id_for_the_same_scope(self):
         """We get the same id returned from get_session_id when we used the
         same scope.
@@ -1,6 +1,7 @@
 import logging
 import os
 
+from twisted.internet.defer import succeed
 from twisted.internet.utils import getProcessOutput
 
 from landscape.client.monitor.plugin import MonitorPlugin
@@ -15,6 +16,8 @@ class PackageMonitor(MonitorPlugin):
     scope = "package"
 
     _reporter_command = None
+    _reporter_running = False
+    _reporter_pending = False
 
     def __init__(self, package_store_filename=None):
         super().__init__()
@@ -113,8 +116,6 @@ class PackageMonitor(MonitorPlugin):
             self._fake_reporter_running = False
 
         if self._fake_reporter_running:
-            from twisted.internet.defer import succeed
-
             return succeed(None)
 
         self._fake_reporter_running = True
@@ -138,6 +139,13 @@ class PackageMonitor(MonitorPlugin):
             else:
                 env["FAKE_GLOBAL_PACKAGE_STORE"] = "1"
 
+        if self._reporter_running:
+            # The running reporter may have already gone past the tasks that
+            # were just queued, so run it once more when it's done.  Any
+            # further requests until then get folded into that single run.
+            self._reporter_pending = True
+            return succeed(None)
+
         if self._reporter_command is None:
             self._reporter_command = find_reporter_command(self.config)
         # path is set to None so that getProcessOutput does not
@@ -150,12 +158,22 @@ class PackageMonitor(MonitorPlugin):
             errortoo=1,
             path=None,
         )
+        self._reporter_running = True
         result.addCallback(self._got_reporter_output)
+        result.addBoth(self._reporter_done)
         return result
 
+    def _reporter_done(self, passthrough):
+        self._reporter_running = False
+        if not self._reporter_pending:
+            return passthrough
+        self._reporter_pending = False
+        result = self.spawn_reporter()
+        return result.addCallback(lambda ignored: passthrough)
+
     def _got_reporter_output(self, output):
         if output:
-            logging.warning(f"Package reporter output:\n{output}")
+            logging.warning("Package reporter output:\n%s", output)
 
     def _reset(self):
         """
@@ -211,6 +211,32 @@ class PackageMonitorTest(LandscapeTest):
 
         return result.addCallback(got_result)
 
+    def test_spawn_reporter_while_running(self):
+        """
+        Requests to spawn the reporter while it's still running are folded
+        into a single extra run, started once the running one is done.
+        """
+        runs_filename = self.makeFile("")
+        self.write_script(
+            self.config,
+            "landscape-package-reporter",
+            f"#!/bin/sh\necho RUN >> {runs_filename}\n",
+        )
+
+        package_monitor = PackageMonitor(self.package_store_filename)
+        self.monitor.add(package_monitor)
+
+        result = package_monitor.spawn_reporter()
+        package_monitor.spawn_reporter()
+        package_monitor.spawn_reporter()
+
+        def got_result(result):
+            with open(runs_filename) as runs_file:
+                self.assertEqual(["RUN\n", "RUN\n"], runs_file.readlines())
+            self.assertFalse(package_monitor._reporter_running)
+
+        return result.addCallback(got_result)
+
     def test_call_on_accepted(self):
         with mock.patch.object(self.package_monitor, "spawn_reporter") as mkd:
             self.monitor.add(self.package_monitor)
@@ -25,7 +25,7 @@ from landscape.lib.apt.package.store import (
 )
 from landscape.lib.config import get_bindir
 from landscape.lib.sequenceranges import sequence_to_ranges
-from landscape.lib.twisted_util import gather_results, spawn_process
+from landscape.lib.twisted_util import spawn_process
 from landscape.lib.fetch import fetch_async
 from landscape.lib.fs import touch_file, create_binary_file
 from landscape.lib.os_release import parse_os_release
@@ -526,7 +526,11 @@ class PackageReporter(PackageTaskHandler):
                 # Request was delivered, and is older than the threshold.
                 request.remove()
 
-        results = []
+        def got_pending(pending, requests):
+            for is_pending, request in zip(pending, requests):
+                update_or_remove(is_pending, request)
+
+        requests = []
         for request in self._store.iter_hash_id_requests():
             if request.message_id is None:
                 # May happen in some rare cases, when a send_message() is
@@ -534,11 +538,17 @@ class PackageReporter(PackageTaskHandler):
                 # request is removed and so we don't get here.
                 request.remove()
             else:
-                result = self._broker.is_message_pending(request.message_id)
-                result.addCallback(update_or_remove, request)
-                results.append(result)
+                requests.append(request)
+
+        if not requests:
+            return succeed(None)
 
-        return gather_results(results)
+        # Check all the messages with a single call, rather than asking the
+        # broker (and have it walk its message store) once per request.
+        result = self._broker.are_messages_pending(
+            [request.message_id for request in requests],
+        )
+        return result.addCallback(got_pending, requests)
 
     def request_unknown_hashes(self):
         """Detect available packages for which we have no hash=>id mappings.
@@ -775,6 +775,35 @@ class PackageReporterAptTest(LandscapeTest):
         result = self.reporter.remove_expired_hash_id_requests()
         return result.addCallback(got_result)
 
+    def test_remove_expired_hash_id_requests_with_many_requests(self):
+        """
+        The pending state of all the requests' messages is checked with a
+        single call to the broker, and each request is updated accordingly.
+        """
+        request1 = self.store.add_hash_id_request([b"hash1"])
+        request1.message_id = 9999
+        request1.timestamp -= HASH_ID_REQUEST_TIMEOUT
+        request2 = self.store.add_hash_id_request([b"hash2"])
+        message_store = self.broker_service.message_store
+        message = {
+            "type": "add-packages",
+            "packages": [],
+            "request-id": request2.id,
+        }
+        request2.message_id = message_store.add(message)
+        initial_timestamp = request2.timestamp
+
+        def got_result(result):
+            self.assertRaises(
+                UnknownHashIDRequest,
+                self.store.get_hash_id_request,
+                request1.id,
+            )
+            self.assertTrue(request2.timestamp > initial_timestamp)
+
+        result = self.reporter.remove_expired_hash_id_requests()
+        return result.addCallback(got_result)
+
     def test_remove_expired_hash_id_request_removes_when_no_message_id(self):
         request = self.store.add_hash_id_request([b"hash1"])
 
@@ -142,12 +142,18 @@ class MethodCallReceiver(CommandLocator):
     @param obj: The Python object to be exposed.
     @param methods: The list of the object's methods that can be called
          remotely.
+    @param method_funcs: Optionally, a C{dict} used to cache the object's
+         bound methods by name. It can be shared by all the receivers of the
+         same object, so each method is looked up only once.
     """
 
-    def __init__(self, obj, methods):
+    def __init__(self, obj, methods, method_funcs=None):
         CommandLocator.__init__(self)
         self._object = obj
         self._methods = methods
+        if method_funcs is None:
+            method_funcs = {}
+        self._method_funcs = method_funcs
         self._pending_chunks = {}
 
     @MethodCall.responder
@@ -179,10 +185,7 @@ class MethodCallReceiver(CommandLocator):
         # We encoded the method name in `send_method_call` and have to decode
         # it here again.
         method = method.decode("utf-8")
-        if method not in self._methods:
-            raise MethodCallError(f"Forbidden method '{method}'")
-
-        method_func = getattr(self._object, method)
+        method_func = self._get_method_func(method)
 
         def handle_result(result):
             return {"result": self._check_result(result)}
@@ -195,6 +198,22 @@ class MethodCallReceiver(CommandLocator):
         deferred.addErrback(handle_failure)
         return deferred
 
+    def _get_method_func(self, method):
+        """Return the bound method of our object called C{method}.
+
+        Bound methods are resolved and looked up in C{self._methods} only the
+        first time a given method is called, and then cached.
+
+        @raises: L{MethodCallError} if C{method} is not an allowed method.
+        """
+        method_func = self._method_funcs.get(method)
+        if method_func is None:
+            if method not in self._methods:
+                raise MethodCallError(f"Forbidden method '{method}'")
+            method_func = getattr(self._object, method)
+            self._method_funcs[method] = method_func
+        return method_func
+
     @MethodCallChunk.responder
     def receive_method_call_chunk(self, sequence, chunk):
         """Receive a part of a multi-chunk L{MethodCall}.
@@ -285,43 +304,36 @@ class MethodCallSender:
             for i in xrange(0, len(arguments), self._chunk_size)
         ]
 
-        result = Deferred()
-        if len(chunks) > 1:
-            # If we have N chunks, send the first N-1 as MethodCallChunk's
-            for chunk in chunks[:-1]:
-
-                def create_send_chunk(sequence, chunk):
-                    def send_chunk(x):
-                        return self._protocol.callRemote(
-                            MethodCallChunk,
-                            sequence=sequence,
-                            chunk=chunk,
-                        )
-
-                    return send_chunk
-
-                result.addCallback(create_send_chunk(sequence, chunk))
-
-        def send_last_chunk(ignored):
-            chunk = chunks[-1]
-            return self._call_remote_with_timeout(
-                MethodCall,
+        # If we have N chunks, send the first N-1 as MethodCallChunk's. We
+        # don't wait for each chunk to be acknowledged before sending the
+        # next one: AMP boxes are delivered in order, so all the chunks and
+        # the final MethodCall end up in the same transport write buffer and
+        # get flushed together, instead of costing a round-trip per chunk.
+        # Failures are reported by the final MethodCall, so errors of the
+        # individual chunks can be ignored.
+        for chunk in chunks[:-1]:
+            sent = self._protocol.callRemote(
+                MethodCallChunk,
                 sequence=sequence,
-                method=method,
-                arguments=chunk,
+                chunk=chunk,
             )
+            sent.addErrback(lambda failure: None)
 
-        result.addCallback(send_last_chunk)
-        result.addCallback(lambda response: response["result"])
-        result.callback(None)
-        return result
+        result = self._call_remote_with_timeout(
+            MethodCall,
+            sequence=sequence,
+            method=method,
+            arguments=chunks[-1],
+        )
+        return result.addCallback(lambda response: response["result"])
 
 
 class MethodCallServerProtocol(AMP):
     """Receive L{MethodCall} commands over the wire and send back results."""
 
-    def __init__(self, obj, methods):
-        AMP.__init__(self, locator=MethodCallReceiver(obj, methods))
+    def __init__(self, obj, methods, method_funcs=None):
+        locator = MethodCallReceiver(obj, methods, method_funcs)
+        AMP.__init__(self, locator=locator)
 
 
 class MethodCallClientProtocol(AMP):
@@ -361,6 +373,9 @@ class RemoteObject:
         L{MethodCall} to the remote peer passing it the arguments and
         keyword arguments it was called with, and returning a L{Deferred}
         resulting in the L{MethodCall}'s response value.
+
+        The created function is stored as an instance attribute, so it's
+        built only the first time C{method} is accessed.
         """
 
         def send_method_call(*args, **kwargs):
@@ -368,6 +383,7 @@ class RemoteObject:
             self._send_method_call(method, args, kwargs, deferred)
             return deferred
 
+        setattr(self, method, send_method_call)
         return send_method_call
 
     def _send_method_call(self, method, args, kwargs, deferred, call=None):
@@ -499,9 +515,10 @@ class MethodCallServerFactory(ServerFactory):
         """
         self.object = obj
         self.methods = methods
+        self.method_funcs = {}
 
     def buildProtocol(self, addr):  # noqa: N802
-        protocol = self.protocol(self.object, self.methods)
+        protocol = self.protocol(self.object, self.methods, self.method_funcs)
         protocol.factory = self
         return protocol
 
@@ -183,6 +183,7 @@ class KeyDict:
         self.optional = set(optional)
         self.schema = schema
         self._strict = strict
+        self._required_keys = set(schema.keys()) - self.optional
 
     def coerce(self, value):
         new_dict = {}
@@ -207,9 +208,7 @@ class KeyDict:
                     f"Value of {k!r} key of dict {value!r} could not coerce "
                     f"with {self.schema[k]}: {e}",
                 )
-        new_keys = set(new_dict.keys())
-        required_keys = set(self.schema.keys()) - self.optional
-        missing = required_keys - new_keys
+        missing = self._required_keys - new_dict.keys()
         if missing:
             raise InvalidError(f"Missing keys {missing}")
         return new_dict
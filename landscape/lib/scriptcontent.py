@@ -5,7 +5,7 @@ def build_script(interpreter, code):
     """
     Concatenates a interpreter and script into an executable script.
     """
-    return "#!{}\n{}".format(interpreter or "", code or "")
+    return f"#!{interpreter or ''}\n{code or ''}"
 
 
 def generate_script_hash(script):
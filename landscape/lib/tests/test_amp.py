@@ -145,6 +145,22 @@ class MethodCallTest(BaseTestCase):
         self.connection.flush()
         self.assertIs(None, self.successResultOf(deferred))
 
+    def test_method_lookup_is_cached(self):
+        """
+        The object's method is looked up only the first time a given
+        L{MethodCall} is received, subsequent calls reuse it.
+        """
+        calls = []
+        self.object.method = lambda: calls.append(None)
+        deferred1 = self.sender.send_method_call(method="method")
+        self.connection.flush()
+        self.object.method = None
+        deferred2 = self.sender.send_method_call(method="method")
+        self.connection.flush()
+        self.successResultOf(deferred1)
+        self.successResultOf(deferred2)
+        self.assertEqual(2, len(calls))
+
     def test_with_return_value(self):
         """
         A connected client can issue a L{MethodCall} targeted to an
@@ -314,6 +330,21 @@ class MethodCallTest(BaseTestCase):
         self.assertEqual(80000, self.successResultOf(deferred1))
         self.assertEqual(90000, self.successResultOf(deferred2))
 
+    def test_with_long_argument_chunks_sent_at_once(self):
+        """
+        The L{MethodCallChunk}s of a L{MethodCall} are all written to the
+        transport without waiting for each of them to be acknowledged.
+        """
+        self.object.method = lambda word: len(word)
+        deferred = self.sender.send_method_call(
+            method="method",
+            args=["!" * 150000],
+            kwargs={},
+        )
+        self.assertEqual(3, len(self.connection.client.transport.stream))
+        self.connection.flush()
+        self.assertEqual(150000, self.successResultOf(deferred))
+
     def test_with_exception(self):
         """
         If the target object method raises an exception, the remote call fails
@@ -455,6 +486,13 @@ class RemoteObjectTest(BaseTestCase):
         deferred = self.remote.method()
         self.assertIs(None, self.successResultOf(deferred))
 
+    def test_method_is_built_once(self):
+        """
+        The function sending L{MethodCall}s for a given method is built only
+        the first time the method is accessed.
+        """
+        self.assertIs(self.remote.method, self.remote.method)
+
     def test_with_return_value(self):
         """
         A L{RemoteObject} can send L{MethodCall}s without arguments and get
@@ -530,6 +568,29 @@ class RemoteObjectTest(BaseTestCase):
         self.assertEqual("Forbidden method 'method'", str(failure.value))
 
 
+class MethodCallServerFactoryTest(BaseTestCase):
+    def test_build_protocol_shares_method_lookups(self):
+        """
+        The protocols built by a L{MethodCallServerFactory} share the lookups
+        of the exposed object's methods.
+        """
+        calls = []
+        obj = DummyObject()
+        obj.method = lambda: calls.append(None)
+        factory = MethodCallServerFactory(obj, ["method"])
+        clock = Clock()
+        for _ in range(2):
+            client = MethodCallClientProtocol()
+            connection = FakeConnection(client, factory.buildProtocol(None))
+            connection.make()
+            sender = MethodCallSender(client, clock)
+            deferred = sender.send_method_call(method="method")
+            connection.flush()
+            self.successResultOf(deferred)
+            obj.method = None
+        self.assertEqual(2, len(calls))
+
+
 class MethodCallClientFactoryTest(BaseTestCase):
     def setUp(self):
         super().setUp()